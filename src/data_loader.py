@@ -1,5 +1,6 @@
 # src/data_loader.py
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from sqlalchemy.exc import SQLAlchemyError
 from database import DatabaseManager
@@ -7,46 +8,96 @@ import logging
 
 from exceptions import DataLoadingError
 
+try:
+    import pyarrow  # noqa: F401
+    DEFAULT_CSV_ENGINE = 'pyarrow'
+except ImportError:
+    DEFAULT_CSV_ENGINE = 'c'
+
+# Every column in train.csv, ideal.csv and test.csv is numeric, so a fixed dtype
+# lets the parser skip type inference.
+CSV_DTYPE = 'float64'
+
 class DataLoader:
     """
     Responsible for loading CSV files into the database tables.
     Utilizes pandas for CSV reading and SQLAlchemy for database I/O.
     """
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, csv_engine: str = DEFAULT_CSV_ENGINE):
         """
         Initialize the DataLoader with a given DatabaseManager.
         
         :param db_manager: An instance of DatabaseManager.
+        :param csv_engine: pandas CSV parser backend ('pyarrow' when installed, otherwise 'c').
         """
         self.db_manager = db_manager
+        self.csv_engine = csv_engine
 
-    def load_csv_to_table(self, csv_path: str, table_name: str) -> None:
+    def read_csv(self, csv_path: str) -> pd.DataFrame:
         """
-        Load a CSV file into a specified database table.
+        Parse a CSV file into a DataFrame with normalized (lower-case) column names.
         
         :param csv_path: Path to the CSV file.
-        :param table_name: Name of the database table to load the data into.
-        :raises DataLoadingError: If file not found or SQL error occurs.
+        :return: The parsed DataFrame.
+        :raises DataLoadingError: If the file is not found or cannot be parsed.
         """
         try:
-            df = pd.read_csv(csv_path)
-            df.columns = [col.lower() for col in df.columns]  # Normalize column names
-            df.to_sql(table_name, self.db_manager.engine, if_exists='replace', index=False)
-            logging.info(f"Data loaded into {table_name} from {csv_path}.")
+            df = pd.read_csv(csv_path, engine=self.csv_engine, dtype=CSV_DTYPE)
         except FileNotFoundError:
             raise DataLoadingError(f"File {csv_path} not found.")
+        except (ValueError, pd.errors.ParserError) as e:
+            raise DataLoadingError(f"Error parsing {csv_path}: {e}")
+        df.columns = [col.lower() for col in df.columns]  # Normalize column names
+        return df
+
+    def write_table(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Write a DataFrame into a specified database table, replacing any existing contents.
+        
+        :param df: DataFrame to store.
+        :param table_name: Name of the database table to load the data into.
+        :raises DataLoadingError: If an SQL error occurs.
+        """
+        try:
+            df.to_sql(table_name, self.db_manager.engine, if_exists='replace', index=False)
         except SQLAlchemyError as e:
             raise DataLoadingError(f"Error loading data into {table_name}: {e}")
 
+    def load_csv_to_table(self, csv_path: str, table_name: str) -> None:
+        """
+        Load a CSV file into a specified database table.
+        
+        :param csv_path: Path to the CSV file.
+        :param table_name: Name of the database table to load the data into.
+        :raises DataLoadingError: If file not found, parsing fails or SQL error occurs.
+        """
+        self.write_table(self.read_csv(csv_path), table_name)
+        logging.info(f"Data loaded into {table_name} from {csv_path}.")
+
     def load_all_data(self, training_file: str, ideal_file: str, test_file: str) -> None:
         """
         Load all three CSV files: training, ideal, and test data into their respective tables.
         
+        The files are parsed concurrently on a thread pool; each parsed DataFrame is then
+        written from the calling thread, so SQLite only ever sees a single writer.
+        
         :param training_file: Path to training data CSV.
         :param ideal_file: Path to ideal functions CSV.
         :param test_file: Path to test data CSV.
+        :raises DataLoadingError: If any file is not found or cannot be parsed, or an SQL error occurs.
         """
-        self.load_csv_to_table(training_file, 'training_data')
-        self.load_csv_to_table(ideal_file, 'ideal_functions')
-        self.load_csv_to_table(test_file, 'test_data')
+        tables = {
+            'training_data': training_file,
+            'ideal_functions': ideal_file,
+            'test_data': test_file,
+        }
+        with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+            futures = {
+                executor.submit(self.read_csv, csv_path): table_name
+                for table_name, csv_path in tables.items()
+            }
+            for future in as_completed(futures):
+                table_name = futures[future]
+                self.write_table(future.result(), table_name)
+                logging.info(f"Data loaded into {table_name} from {tables[table_name]}.")
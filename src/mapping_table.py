@@ -0,0 +1,71 @@
+# src/mapping_table.py
+
+import numpy as np
+import pandas as pd
+from exceptions import TestMappingError
+
+class MappingTable:
+    """
+    Precomputed lookup table of the selected ideal functions over the ideal x-grid.
+    Holds a contiguous matrix of selected-function values (one row per grid point,
+    one column per selected function) and the matching max deviation thresholds.
+    """
+
+    def __init__(self, ideal_df: pd.DataFrame, selected: list, max_deviations: list):
+        """
+        Build the mapping table from the ideal functions and the selected functions.
+        
+        :param ideal_df: DataFrame of the 'ideal_functions' table (x, y1 ... y50).
+        :param selected: List of selected ideal function numbers.
+        :param max_deviations: Max allowed deviation for each selected function.
+        :raises TestMappingError: If the ideal functions table is empty.
+        """
+        if ideal_df.empty:
+            raise TestMappingError("Ideal functions table is empty.")
+
+        # Keep the first row for each x value, sorted by x, so lookups can use binary search
+        self.grid_x, self.grid_rows = np.unique(ideal_df['x'].to_numpy(dtype=float), return_index=True)
+        columns = [f'y{func_no}' for func_no in selected]
+        self.values = np.ascontiguousarray(ideal_df[columns].to_numpy(dtype=float)[self.grid_rows])
+        self.thresholds = np.asarray(max_deviations, dtype=float)
+        self.functions = np.asarray(selected)
+
+    def nearest_rows(self, x: np.ndarray) -> np.ndarray:
+        """
+        Find the grid row for each x value: the exact match if present, otherwise the closest x.
+        On a tie between two neighbours the one appearing first in the ideal table wins.
+        
+        :param x: Array of x values.
+        :return: Array of row indices into the mapping table.
+        """
+        last = len(self.grid_x) - 1
+        right = np.clip(np.searchsorted(self.grid_x, x), 0, last)
+        left = np.clip(right - 1, 0, last)
+        dist_left = np.abs(x - self.grid_x[left])
+        dist_right = np.abs(self.grid_x[right] - x)
+        use_right = (dist_right < dist_left) | (
+            (dist_right == dist_left) & (self.grid_rows[right] < self.grid_rows[left])
+        )
+        return np.where(use_right, right, left)
+
+    def map_batch(self, x: np.ndarray, y: np.ndarray):
+        """
+        Compute the best fitting selected function for a batch of points and check it against
+        its max deviation threshold.
+        
+        :param x: Array of x values.
+        :param y: Array of y values.
+        :return: Tuple (best, delta_y, accepted) of arrays, where best indexes the selected
+                 functions, delta_y is the smallest deviation and accepted is a boolean mask.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        deviations = self.values[self.nearest_rows(x)]
+        np.subtract(deviations, y[:, np.newaxis], out=deviations)
+        np.abs(deviations, out=deviations)
+
+        best = deviations.argmin(axis=1)
+        delta_y = deviations[np.arange(len(best)), best]
+        accepted = delta_y <= self.thresholds[best]
+        return best, delta_y, accepted
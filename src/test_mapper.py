@@ -1,8 +1,10 @@
 # src/test_mapper.py
 
+import numpy as np
 import pandas as pd
 import logging
 from database import DatabaseManager
+from mapping_table import MappingTable
 from exceptions import TestMappingError
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -21,6 +23,7 @@ class TestMapper:
         self.db_manager = db_manager
         self.function_selector = function_selector
         self.session = self.db_manager.get_session()
+        self.rejected_counts = {}
 
     def map_test_data(self) -> None:
         """
@@ -29,12 +32,15 @@ class TestMapper:
         
         Steps:
         1. Retrieve selected functions and their max deviations.
-        2. For each test data point, find the ideal function value, compute deviation.
-        3. Assign the test point to the ideal function if deviation <= max_deviation.
-        4. Save all assigned test points into 'test_results' table.
+        2. Build a MappingTable of the selected functions over the ideal x-grid.
+        3. For all test data points at once, find the ideal function values, compute deviations
+           and pick the best fitting function.
+        4. Assign the test point to the ideal function if deviation <= max_deviation.
+        5. Save all assigned test points into 'test_results' table.
         
         :raises TestMappingError: If there's an error during the mapping process.
         """
+        self.rejected_counts = {}
         selected = self.function_selector.get_selected_functions()
         max_devs = self.function_selector.get_max_deviations()
 
@@ -48,43 +54,23 @@ class TestMapper:
         except SQLAlchemyError as e:
             raise TestMappingError(f"Error reading from database: {e}")
 
-        results = []
-        for _, test_row in test_df.iterrows():
-            x_val = test_row['x']
-            y_val = test_row['y']
-            deviations = []
+        table = MappingTable(ideal_df, selected, max_devs)
+        best, delta_y, accepted = table.map_batch(test_df['x'].to_numpy(), test_df['y'].to_numpy())
 
-            # Find deviations for each selected ideal function
-            for idx, func_no in enumerate(selected):
-                # Find ideal y for the given x
-                ideal_subset = ideal_df[ideal_df['x'] == x_val]
-                if ideal_subset.empty:
-                    # If exact x not found, choose the closest x
-                    nearest_idx = (ideal_df['x'] - x_val).abs().idxmin()
-                    ideal_y = ideal_df.at[nearest_idx, f'y{func_no}']
-                else:
-                    ideal_y = ideal_subset.iloc[0][f'y{func_no}']
+        # Count the points rejected by each selected function's max deviation threshold;
+        # an ideal function may be selected more than once, so its counts are summed
+        rejected = np.bincount(best[~accepted], minlength=len(selected))
+        for func_no, count in zip(selected, rejected):
+            self.rejected_counts[int(func_no)] = self.rejected_counts.get(int(func_no), 0) + int(count)
+        logging.info(f"Rejected test points per ideal function: {self.rejected_counts}")
 
-                deviation = abs(y_val - ideal_y)
-                deviations.append(deviation)
-
-            # Determine best fit function
-            if deviations:
-                min_dev = min(deviations)
-                best_func_index = deviations.index(min_dev)
-                best_func = selected[best_func_index]
-
-                # Check against max deviation threshold
-                if min_dev <= max_devs[best_func_index]:
-                    results.append({
-                        'x': x_val,
-                        'y': y_val,
-                        'delta_y': min_dev,
-                        'ideal_function': best_func
-                    })
-
-        if results:
-            results_df = pd.DataFrame(results)
+        if accepted.any():
+            results_df = pd.DataFrame({
+                'x': test_df['x'].to_numpy()[accepted],
+                'y': test_df['y'].to_numpy()[accepted],
+                'delta_y': delta_y[accepted],
+                'ideal_function': table.functions[best[accepted]]
+            })
             try:
                 results_df.to_sql('test_results', self.db_manager.engine, if_exists='replace', index=False)
                 logging.info("Test data mapping completed. Results stored in 'test_results'.")
@@ -92,3 +78,12 @@ class TestMapper:
                 raise TestMappingError(f"Error writing test results to database: {e}")
         else:
             logging.info("No test data points matched the deviation criteria.")
+
+    def get_rejected_counts(self) -> dict:
+        """
+        Get the number of test points rejected by each selected function's max deviation
+        during the last mapping run.
+        
+        :return: A dict mapping ideal function numbers to rejected point counts.
+        """
+        return self.rejected_counts
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import tempfile
 import unittest
 import pandas as pd
 
@@ -14,6 +15,18 @@ sys.path.insert(0, src_dir)
 from function_selector import FunctionSelector
 from database import DatabaseManager
 from test_mapper import TestMapper
+from mapping_table import MappingTable
+from data_loader import DataLoader
+from exceptions import DataLoadingError
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# CSV parser backends to exercise; pyarrow is only tested when it is installed
+CSV_ENGINES = ['c', 'pyarrow'] if HAS_PYARROW else ['c']
 
 class TestIdealFunctionMapping(unittest.TestCase):
     def setUp(self):
@@ -114,6 +127,108 @@ class TestIdealFunctionMapping(unittest.TestCase):
         for _, row in results_df.iterrows():
             self.assertEqual(row['delta_y'], 0.0)
 
+    def test_mapping_table_nearest_x_and_rejections(self):
+        """
+        Test that MappingTable falls back to the closest x for off-grid points
+        and that TestMapper reports points rejected by the max deviation.
+        """
+        ideal_functions = pd.DataFrame({
+            'x': [1, 2, 3, 4],
+            'y1': [1.1, 2.1, 3.1, 4.1],
+            'y2': [2.2, 3.2, 4.2, 5.2],
+        })
+        table = MappingTable(ideal_functions, [1, 2], [0.5, 0.5])
+        best, delta_y, accepted = table.map_batch([0.0, 2.4, 2.6, 4.0], [1.1, 2.2, 4.2, 9.0])
+
+        self.assertListEqual(table.functions[best].tolist(), [1, 1, 2, 2])
+        self.assertListEqual(accepted.tolist(), [True, True, True, False])
+        self.assertAlmostEqual(delta_y[1], 0.1)
+
+        training_data = pd.DataFrame({
+            'x': [1, 2, 3, 4],
+            'y1': [1, 2, 3, 4],
+            'y2': [2, 3, 4, 5],
+            'y3': [3, 4, 5, 6],
+            'y4': [4, 5, 6, 7]
+        })
+        ideal_functions = pd.DataFrame({
+            'x': [1, 2, 3, 4],
+            'y1': [1.1, 2.1, 3.1, 4.1],
+            'y2': [2.2, 3.2, 4.2, 5.2],
+            'y3': [3.3, 4.3, 5.3, 6.3],
+            'y4': [4.4, 5.4, 6.4, 7.4],
+            'y5': [5, 6, 7, 8],
+        })
+        for i in range(6, 51):
+            ideal_functions[f'y{i}'] = ideal_functions['y5'] + i + 0.1
+
+        training_data.to_sql('training_data', self.db_manager.engine, if_exists='replace', index=False)
+        ideal_functions.to_sql('ideal_functions', self.db_manager.engine, if_exists='replace', index=False)
+
+        test_data = pd.DataFrame({
+            'x': [1.0, 2.0, 3.0, 4.0],
+            'y': [1.1, 3.2, 5.3, 100.0]  # Last point is far from every selected function
+        })
+        test_data.to_sql('test_data', self.db_manager.engine, if_exists='replace', index=False)
+
+        selector = FunctionSelector(self.db_manager)
+        selector.calculate_least_squares()
+        mapper = TestMapper(self.db_manager, selector)
+        mapper.map_test_data()
+
+        results_df = pd.read_sql_table('test_results', self.db_manager.engine)
+        self.assertListEqual(results_df['ideal_function'].tolist(), [1, 2, 3])
+        self.assertDictEqual(mapper.get_rejected_counts(), {1: 0, 2: 0, 3: 0, 4: 1})
+
+        # A run without selected functions must not report the previous counts
+        selector.selected_functions = []
+        mapper.map_test_data()
+        self.assertDictEqual(mapper.get_rejected_counts(), {})
+
+    def test_mapping_table_tie_breaks(self):
+        """
+        Test that MappingTable uses the first row for duplicate x values and
+        the earlier table row for points halfway between two grid points.
+        """
+        ideal_functions = pd.DataFrame({
+            'x': [3, 1, 2, 2],
+            'y1': [30, 10, 20, 99],
+        })
+        table = MappingTable(ideal_functions, [1], [0.0])
+        rows = table.nearest_rows([2.0, 1.5, 2.5])
+
+        # x=2 -> first duplicate row; 1.5 -> x=1 (row 1 before row 2); 2.5 -> x=3 (row 0 before row 2)
+        self.assertListEqual(table.values[rows, 0].tolist(), [20.0, 10.0, 30.0])
+
+    def test_rejected_counts_duplicate_selection(self):
+        """
+        Test that rejected points are counted once per ideal function
+        when the same function is selected more than once.
+        """
+        ideal_functions = pd.DataFrame({
+            'x': [1, 2, 3, 4],
+            'y1': [1.1, 2.1, 3.1, 4.1],
+            'y3': [3.3, 4.3, 5.3, 6.3],
+            'y4': [4.4, 5.4, 6.4, 7.4],
+        })
+        ideal_functions.to_sql('ideal_functions', self.db_manager.engine, if_exists='replace', index=False)
+
+        test_data = pd.DataFrame({
+            'x': [1.0, 2.0, 3.0, 4.0],
+            'y': [1.15, 2.15, 3.15, 6.3]  # First three are closest to y1, last matches y3
+        })
+        test_data.to_sql('test_data', self.db_manager.engine, if_exists='replace', index=False)
+
+        selector = FunctionSelector(self.db_manager)
+        selector.selected_functions = [1, 1, 3, 4]
+        selector.max_deviations = [0.0, 10.0, 0.5, 0.5]
+        mapper = TestMapper(self.db_manager, selector)
+        mapper.map_test_data()
+
+        results_df = pd.read_sql_table('test_results', self.db_manager.engine)
+        self.assertListEqual(results_df['ideal_function'].tolist(), [3])
+        self.assertDictEqual(mapper.get_rejected_counts(), {1: 3, 3: 0, 4: 0})
+
     def test_empty_training_data(self):
         """
         Test handling of empty training data.
@@ -166,6 +281,68 @@ class TestIdealFunctionMapping(unittest.TestCase):
         selected = selector.get_selected_functions()
         self.assertEqual(len(selected), 0)
 
+    def load_all_data_with_engine(self, csv_engine):
+        """
+        Load three small CSV files with the given parser backend and check
+        that they land in their tables with lower-cased column names.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            training_file = os.path.join(tmp_dir, 'train.csv')
+            ideal_file = os.path.join(tmp_dir, 'ideal.csv')
+            test_file = os.path.join(tmp_dir, 'test.csv')
+            pd.DataFrame({'X': [1, 2], 'Y1': [1, 2], 'Y2': [2, 3], 'Y3': [3, 4], 'Y4': [4, 5]}).to_csv(training_file, index=False)
+            pd.DataFrame({'X': [1, 2], 'Y1': [1.1, 2.1]}).to_csv(ideal_file, index=False)
+            pd.DataFrame({'X': [1.5], 'Y': [1.6]}).to_csv(test_file, index=False)
+
+            loader = DataLoader(self.db_manager, csv_engine=csv_engine)
+            loader.load_all_data(training_file, ideal_file, test_file)
+
+        training_df = pd.read_sql_table('training_data', self.db_manager.engine)
+        ideal_df = pd.read_sql_table('ideal_functions', self.db_manager.engine)
+        test_df = pd.read_sql_table('test_data', self.db_manager.engine)
+        self.assertListEqual(list(training_df.columns), ['x', 'y1', 'y2', 'y3', 'y4'])
+        self.assertListEqual(ideal_df['y1'].tolist(), [1.1, 2.1])
+        self.assertListEqual(test_df['y'].tolist(), [1.6])
+
+    def test_load_all_data_c_engine(self):
+        """
+        Test DataLoader.load_all_data with the pandas C parser.
+        """
+        self.load_all_data_with_engine('c')
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_load_all_data_pyarrow_engine(self):
+        """
+        Test DataLoader.load_all_data with the pyarrow parser.
+        """
+        self.load_all_data_with_engine('pyarrow')
+
+    def test_load_all_data_missing_file(self):
+        """
+        Test that a missing CSV file raises DataLoadingError.
+        """
+        loader = DataLoader(self.db_manager)
+        with self.assertRaises(DataLoadingError):
+            loader.load_all_data('missing_train.csv', 'missing_ideal.csv', 'missing_test.csv')
+
+    def test_load_malformed_csv(self):
+        """
+        Test that non-numeric cells and empty files raise DataLoadingError.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            malformed_file = os.path.join(tmp_dir, 'malformed.csv')
+            empty_file = os.path.join(tmp_dir, 'empty.csv')
+            with open(malformed_file, 'w') as f:
+                f.write('x,y\n1,abc\n')
+            open(empty_file, 'w').close()
+
+            for csv_engine in CSV_ENGINES:
+                loader = DataLoader(self.db_manager, csv_engine=csv_engine)
+                for csv_path in [malformed_file, empty_file]:
+                    with self.subTest(csv_engine=csv_engine, csv_path=csv_path):
+                        with self.assertRaises(DataLoadingError):
+                            loader.load_csv_to_table(csv_path, 'test_data')
+
 
 if __name__ == '__main__':
     unittest.main()